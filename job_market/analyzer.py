@@ -1,58 +1,383 @@
+import os
+
+from collections import Counter
+
+import numpy as np
 import pandas as pd
-from typing import Optional, Dict, Union
+import pyarrow as pa
+from functools import cached_property
+from pyarrow import csv as pacsv
+from pyarrow import parquet as pq
+from typing import Optional, Dict, List, Union
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
 
 class JobAnalyzer:
     """
     A class to analyze job market data from CSV files.
-    
+
     Attributes:
-        df (pd.DataFrame): The dataframe containing the job data.
+        df (Optional[pd.DataFrame]): The dataframe containing the job data,
+            or None when the analyzer was built with from_large_csv.
     """
 
-    def __init__(self, csv_path: str) -> None:
+    def __init__(self, csv_path: str, backend: str = 'pandas') -> None:
         """
         Initializes the analyzer, standardizes columns, and loads data.
 
         Args:
             csv_path (str): The file path to the CSV dataset.
+            backend (str): Either 'pandas' (default) or 'polars'. The polars
+                backend loads the CSV with polars and runs the hot
+                aggregations through its multithreaded engine.
+
+        Raises:
+            FileNotFoundError: If the CSV file does not exist.
+            ValueError: If the CSV file is missing required columns or the
+                backend name is unknown.
+            ImportError: If backend='polars' is requested but polars is not
+                installed.
+        """
+        if backend not in ('pandas', 'polars'):
+            raise ValueError(f"Unknown backend: {backend!r}. Use 'pandas' or 'polars'.")
+
+        required_cols = ['job_title', 'salary_in_usd', 'experience_level']
+        sidecar = csv_path + '.parquet'
+        self._pl = None
+
+        if backend == 'polars':
+            if pl is None:
+                raise ImportError("The 'polars' backend requires the polars package.")
+            self._pl = self._read_csv_polars(csv_path, required_cols)
+            self.df: pd.DataFrame = self._pl.to_pandas()
+        else:
+            self.df = None
+            if (os.path.exists(csv_path) and os.path.exists(sidecar)
+                    and os.path.getmtime(sidecar) >= os.path.getmtime(csv_path)):
+                try:
+                    with pa.memory_map(sidecar, 'r') as source:
+                        table = pq.read_table(source, columns=required_cols)
+                    self.df = table.to_pandas(types_mapper=pd.ArrowDtype)
+                except (pa.ArrowInvalid, OSError):
+                    # A crashed or interrupted writer left a bad sidecar;
+                    # drop it and fall back to parsing the CSV.
+                    try:
+                        os.remove(sidecar)
+                    except OSError:
+                        pass
+            if self.df is None:
+                self.df = self._read_csv(csv_path, required_cols)
+                tmp_sidecar = sidecar + '.tmp'
+                try:
+                    pq.write_table(pa.Table.from_pandas(self.df, preserve_index=False),
+                                   tmp_sidecar, compression='zstd', use_dictionary=True)
+                    os.replace(tmp_sidecar, sidecar)
+                except OSError:
+                    try:
+                        os.remove(tmp_sidecar)
+                    except OSError:
+                        pass
+
+        self.df['experience_level'] = self.df['experience_level'].astype(
+            pd.CategoricalDtype(categories=self._EXPERIENCE_ORDER, ordered=True))
+        self.df['job_title'] = self.df['job_title'].astype('category')
+        self._salary = np.ascontiguousarray(self.df['salary_in_usd'].to_numpy(dtype=np.float32))
+        self._exp_sums, self._exp_counts = self._experience_bincounts(self.df)
+        self._title_counts = np.bincount(
+            self.df['job_title'].cat.codes.to_numpy(),
+            minlength=len(self.df['job_title'].cat.categories))
+
+    @classmethod
+    def from_large_csv(cls, csv_path: str, chunksize: int = 1_000_000) -> 'JobAnalyzer':
+        """
+        Builds an analyzer from a CSV file too large to hold in memory.
+
+        The file is read in chunks and reduced to running aggregates (title
+        counts, per-level salary sums, min/max and a salary histogram); the
+        full DataFrame is never materialized, so get_data() is unavailable on
+        the returned analyzer.
+
+        Args:
+            csv_path (str): The file path to the CSV dataset.
+            chunksize (int): The number of rows to read per chunk.
+
+        Returns:
+            JobAnalyzer: An analyzer backed by streaming aggregates.
+
+        Raises:
+            FileNotFoundError: If the CSV file does not exist.
+            ValueError: If the CSV file is missing required columns.
+        """
+        self = cls.__new__(cls)
+        self.df = None
+        self._pl = None
+
+        required_cols = ['job_title', 'salary_in_usd', 'experience_level']
+        rename_map = self._resolve_columns(csv_path, required_cols)
+        source_cols = {target: source for source, target in rename_map.items()}
+
+        self._title_counter: Counter = Counter()
+        self._salary_counter: Counter = Counter()
+        self._salary_min = np.inf
+        self._salary_max = -np.inf
+        self._salary_sum = 0.0
+        self._salary_count = 0
+        self._exp_sums = np.zeros(4)
+        self._exp_counts = np.zeros(4, dtype=np.int64)
+        self._growth: Dict[str, tuple] = {}
+        self._richest: Optional[Dict[str, object]] = None
+
+        reader = pd.read_csv(
+            csv_path,
+            usecols=[source_cols.get(c, c) for c in required_cols],
+            dtype={source_cols.get('salary_in_usd', 'salary_in_usd'): 'float32'},
+            na_values=['', 'NULL', '\\N'],
+            chunksize=chunksize
+        )
+        for chunk in reader:
+            chunk.rename(columns=rename_map, inplace=True)
+            chunk.dropna(subset=required_cols, inplace=True)
+            if not chunk.empty:
+                self._consume_chunk(chunk)
+        return self
+
+    def _consume_chunk(self, chunk: pd.DataFrame) -> None:
+        """
+        Folds one CSV chunk into the running aggregates.
+
+        Args:
+            chunk (pd.DataFrame): A cleaned chunk with the required columns.
+        """
+        salaries = chunk['salary_in_usd'].to_numpy(dtype=np.float64)
+        self._salary_count += salaries.size
+        self._salary_sum += float(salaries.sum())
+        self._salary_min = min(self._salary_min, float(salaries.min()))
+        self._salary_max = max(self._salary_max, float(salaries.max()))
+        self._salary_counter.update(chunk['salary_in_usd'].value_counts().to_dict())
+        self._title_counter.update(chunk['job_title'].value_counts().to_dict())
+
+        i = int(salaries.argmax())
+        if self._richest is None or salaries[i] > self._richest['Salary (USD)']:
+            row = chunk.iloc[i]
+            self._richest = {
+                'Job Title': row['job_title'],
+                'Salary (USD)': row['salary_in_usd'],
+                'Experience': row['experience_level']
+            }
+
+        exp_codes = pd.Categorical(chunk['experience_level'],
+                                   categories=self._EXPERIENCE_ORDER).codes
+        valid = exp_codes >= 0
+        self._exp_sums += np.bincount(exp_codes[valid], weights=salaries[valid], minlength=4)
+        self._exp_counts += np.bincount(exp_codes[valid], minlength=4)
+
+        chunk = chunk.assign(_exp_code=exp_codes)
+        for title, sub in chunk.groupby('job_title', sort=False):
+            codes = sub['_exp_code'].to_numpy()
+            v = codes >= 0
+            sums = np.bincount(codes[v], minlength=4,
+                               weights=sub['salary_in_usd'].to_numpy(dtype=np.float64)[v])
+            counts = np.bincount(codes[v], minlength=4)
+            if title in self._growth:
+                prev_sums, prev_counts = self._growth[title]
+                self._growth[title] = (prev_sums + sums, prev_counts + counts)
+            else:
+                self._growth[title] = (sums, counts)
+
+    def _streamed_median(self) -> float:
+        """
+        Computes the exact salary median from the streamed value histogram.
+
+        Returns:
+            float: The median salary.
+        """
+        items = sorted(self._salary_counter.items())
+        values = np.array([v for v, _ in items], dtype=np.float64)
+        cum = np.cumsum([c for _, c in items])
+        total = int(cum[-1])
+        lo = values[np.searchsorted(cum, (total - 1) // 2, side='right')]
+        hi = values[np.searchsorted(cum, total // 2, side='right')]
+        return (lo + hi) / 2
+
+    def _resolve_columns(self, csv_path: str, required_cols: List[str]) -> Dict[str, str]:
+        """
+        Peeks at the CSV header and validates the required columns.
+
+        Args:
+            csv_path (str): The file path to the CSV dataset.
+            required_cols (List[str]): The standard column names to look for.
+
+        Returns:
+            Dict[str, str]: A mapping from original column names to standard names.
 
         Raises:
             FileNotFoundError: If the CSV file does not exist.
             ValueError: If the CSV file is missing required columns.
         """
         try:
-            self.df: pd.DataFrame = pd.read_csv(csv_path)
-            self._standardize_columns()
-            
-            required_cols = ['job_title', 'salary_in_usd', 'experience_level']
-            
-            missing = [c for c in required_cols if c not in self.df.columns]
-            
-            if missing:
-                raise ValueError(f"CSV file is invalid. Missing required columns: {missing}")
-            
-            self.df.dropna(subset=required_cols, inplace=True)
-            self.df['salary_in_usd'] = pd.to_numeric(self.df['salary_in_usd'], errors='coerce')
-            
+            header_cols = pd.read_csv(csv_path, nrows=0).columns.tolist()
         except FileNotFoundError:
             raise FileNotFoundError(f"File {csv_path} not found.")
 
-    def _standardize_columns(self) -> None:
+        rename_map = self._standardize_columns(header_cols)
+        renamed_cols = [rename_map.get(c, c) for c in header_cols]
+
+        missing = [c for c in required_cols if c not in renamed_cols]
+
+        if missing:
+            raise ValueError(f"CSV file is invalid. Missing required columns: {missing}")
+
+        return rename_map
+
+    def _read_csv(self, csv_path: str, required_cols: List[str]) -> pd.DataFrame:
         """
-        Automatically renames columns to standard names based on a synonym map.
+        Parses the CSV file, keeping only the required columns.
+
+        Args:
+            csv_path (str): The file path to the CSV dataset.
+            required_cols (List[str]): The standard column names to load.
+
+        Returns:
+            pd.DataFrame: The cleaned, Arrow-backed dataframe.
+
+        Raises:
+            FileNotFoundError: If the CSV file does not exist.
+            ValueError: If the CSV file is missing required columns.
         """
-        column_map = {
-            'job_title': ['job_title', 'title', 'role', 'position'],
-            'salary_in_usd': ['salary_in_usd', 'salary', 'salary_usd', 'gross_salary'],
-            'experience_level': ['experience_level', 'experience', 'exp_level', 'level']
+        rename_map = self._resolve_columns(csv_path, required_cols)
+        source_cols = {target: source for source, target in rename_map.items()}
+        column_types = {
+            source_cols.get('job_title', 'job_title'): pa.dictionary(pa.int32(), pa.string()),
+            source_cols.get('salary_in_usd', 'salary_in_usd'): pa.float32(),
+            source_cols.get('experience_level', 'experience_level'): pa.dictionary(pa.int32(), pa.string())
         }
-        existing_cols_lower = {col.lower(): col for col in self.df.columns}
-        for target, aliases in column_map.items():
-            if target in self.df.columns: continue
-            for alias in aliases:
-                if alias.lower() in existing_cols_lower:
-                    self.df.rename(columns={existing_cols_lower[alias.lower()]: target}, inplace=True)
-                    break
+        read_options = pacsv.ReadOptions(block_size=4 << 20, use_threads=True)
+        convert_options = pacsv.ConvertOptions(
+            include_columns=[source_cols.get(c, c) for c in required_cols],
+            column_types=column_types,
+            null_values=['', 'NULL', '\\N'],
+            strings_can_be_null=True
+        )
+        table = pacsv.read_csv(csv_path, read_options=read_options, convert_options=convert_options)
+        table = table.rename_columns(required_cols)
+
+        df = table.to_pandas(types_mapper=pd.ArrowDtype)
+        df.dropna(subset=required_cols, inplace=True)
+        return df
+
+    def _read_csv_polars(self, csv_path: str, required_cols: List[str]) -> 'pl.DataFrame':
+        """
+        Parses the CSV file with polars, keeping only the required columns.
+
+        Args:
+            csv_path (str): The file path to the CSV dataset.
+            required_cols (List[str]): The standard column names to load.
+
+        Returns:
+            pl.DataFrame: The cleaned polars dataframe.
+
+        Raises:
+            FileNotFoundError: If the CSV file does not exist.
+            ValueError: If the CSV file is missing required columns.
+        """
+        rename_map = self._resolve_columns(csv_path, required_cols)
+        source_cols = {target: source for source, target in rename_map.items()}
+
+        sources = [source_cols.get(c, c) for c in required_cols]
+        frame = pl.read_csv(
+            csv_path,
+            columns=sources,
+            schema_overrides={
+                source_cols.get('job_title', 'job_title'): pl.Categorical,
+                source_cols.get('salary_in_usd', 'salary_in_usd'): pl.Float32,
+                source_cols.get('experience_level', 'experience_level'): pl.Categorical
+            },
+            null_values=['NULL', '\\N']
+        )
+        frame = frame.rename({source_cols.get(c, c): c for c in required_cols})
+        return frame.select(required_cols).drop_nulls(required_cols)
+
+    _EXPERIENCE_ORDER = ['EN', 'MI', 'SE', 'EX']
+    _EXPERIENCE_LABELS = ['Entry-level (Junior)', 'Mid-level', 'Senior', 'Executive']
+
+    _ALIAS_TO_TARGET = {
+        'job_title': 'job_title', 'title': 'job_title',
+        'role': 'job_title', 'position': 'job_title',
+        'salary_in_usd': 'salary_in_usd', 'salary': 'salary_in_usd',
+        'salary_usd': 'salary_in_usd', 'gross_salary': 'salary_in_usd',
+        'experience_level': 'experience_level', 'experience': 'experience_level',
+        'exp_level': 'experience_level', 'level': 'experience_level'
+    }
+
+    def _standardize_columns(self, columns: List[str]) -> Dict[str, str]:
+        """
+        Computes a rename mapping to standard column names based on a synonym map.
+
+        Args:
+            columns (List[str]): The column names found in the CSV file.
+
+        Returns:
+            Dict[str, str]: A mapping from original column names to standard names.
+        """
+        rename_map: Dict[str, str] = {}
+        for col in columns:
+            target = self._ALIAS_TO_TARGET.get(col.lower())
+            if target is None or target in columns or target in rename_map.values():
+                continue
+            rename_map[col] = target
+        return rename_map
+
+    @cached_property
+    def _job_counts(self) -> pd.Series:
+        """
+        Returns memoized vacancy counts per job title.
+
+        The frame is read-only after __init__, so the counts are computed once
+        and reused by every caller.
+
+        Returns:
+            pd.Series: Job titles as index, vacancy counts as values, descending.
+        """
+        if self.df is None:
+            return pd.Series(self._title_counter).sort_values(ascending=False)
+        if self._pl is not None:
+            counts = self._pl.group_by('job_title').len().sort('len', descending=True)
+            return pd.Series(counts['len'].to_list(),
+                             index=counts['job_title'].to_list(), name='count')
+        return self.df['job_title'].value_counts()
+
+    @staticmethod
+    def _experience_bincounts(data_frame: pd.DataFrame) -> tuple:
+        """
+        Computes salary sums and row counts per experience level code.
+
+        Args:
+            data_frame (pd.DataFrame): The data to reduce.
+
+        Returns:
+            tuple: Two length-4 arrays with salary sums and counts per level.
+        """
+        exp_codes = data_frame['experience_level'].cat.codes.to_numpy()
+        salaries = data_frame['salary_in_usd'].to_numpy(dtype=np.float64)
+        valid = exp_codes >= 0
+        sums = np.bincount(exp_codes[valid], weights=salaries[valid], minlength=4)
+        counts = np.bincount(exp_codes[valid], minlength=4)
+        return sums, counts
+
+    def _invalidate(self) -> None:
+        """
+        Clears the memoized aggregates. Call this if self.df is ever mutated.
+        """
+        self.__dict__.pop('_job_counts', None)
+        if self.df is not None:
+            self._salary = np.ascontiguousarray(self.df['salary_in_usd'].to_numpy(dtype=np.float32))
+            self._exp_sums, self._exp_counts = self._experience_bincounts(self.df)
+            self._title_counts = np.bincount(
+                self.df['job_title'].cat.codes.to_numpy(),
+                minlength=len(self.df['job_title'].cat.categories))
 
     def get_data(self) -> pd.DataFrame:
         """
@@ -60,7 +385,13 @@ class JobAnalyzer:
 
         Returns:
             pd.DataFrame: The internal dataframe used for analysis.
+
+        Raises:
+            ValueError: If the analyzer was created with from_large_csv and
+                therefore keeps no full dataframe.
         """
+        if self.df is None:
+            raise ValueError("Full data is not available for analyzers created with from_large_csv().")
         return self.df
 
     def get_salary_stats(self) -> Dict[str, float]:
@@ -70,12 +401,20 @@ class JobAnalyzer:
         Returns:
             Dict[str, float]: A dictionary containing 'min', 'max', 'avg', and 'median'.
         """
+        if self.df is None:
+            if self._salary_count == 0: return {}
+            return {
+                "min": float(self._salary_min),
+                "max": float(self._salary_max),
+                "avg": round(self._salary_sum / self._salary_count, 2),
+                "median": float(self._streamed_median())
+            }
         if self.df.empty: return {}
         return {
-            "min": float(self.df['salary_in_usd'].min()),
-            "max": float(self.df['salary_in_usd'].max()),
-            "avg": round(float(self.df['salary_in_usd'].mean()), 2),
-            "median": float(self.df['salary_in_usd'].median())
+            "min": float(self._salary.min()),
+            "max": float(self._salary.max()),
+            "avg": round(float(self._salary.mean()), 2),
+            "median": float(np.median(self._salary))
         }
 
     def get_top_professions(self, n: int) -> pd.Series:
@@ -88,7 +427,16 @@ class JobAnalyzer:
         Returns:
             pd.Series: A series with job titles as index and counts as values.
         """
-        return self.df['job_title'].value_counts().head(n)
+        if self.df is None or self._pl is not None:
+            return self._job_counts.head(n)
+        counts = self._title_counts
+        if n < counts.size:
+            idx = np.argpartition(-counts, n)[:n]
+        else:
+            idx = np.arange(counts.size)
+        idx = idx[np.argsort(-counts[idx], kind='stable')]
+        return pd.Series(counts[idx],
+                         index=self.df['job_title'].cat.categories[idx], name='count')
 
     def get_salary_stats_table(self) -> pd.DataFrame:
         """
@@ -122,10 +470,15 @@ class JobAnalyzer:
         Returns:
             pd.DataFrame: A single-row dataframe with Job Title, Salary, and Experience.
         """
-        richest = self.df.sort_values(by='salary_in_usd', ascending=False).iloc[0]
-        df = pd.DataFrame([richest[['job_title', 'salary_in_usd', 'experience_level']]])
-        df.columns = ['Job Title', 'Salary (USD)', 'Experience']
-        return df
+        if self.df is None:
+            return pd.DataFrame([self._richest])
+        i = int(self._salary.argmax())
+        row = self.df.iloc[i]
+        return pd.DataFrame([{
+            'Job Title': row['job_title'],
+            'Salary (USD)': row['salary_in_usd'],
+            'Experience': row['experience_level']
+        }])
 
     def get_experience_stats_table(self) -> pd.DataFrame:
         """
@@ -146,10 +499,44 @@ class JobAnalyzer:
         Returns:
             Optional[pd.DataFrame]: A table with salary stats, or None if job not found.
         """
-        mask = self.df['job_title'] == target_job
-        df_filtered = self.df[mask]
-        if df_filtered.empty: return None
-        return self._build_experience_table(df_filtered)
+        if self.df is None:
+            entry = self._growth.get(target_job)
+            if entry is None: return None
+            sums, counts = entry
+            if counts.sum() == 0: return None
+            return self._format_experience_table(sums, counts)
+
+        if self._pl is not None:
+            result = (self._pl.lazy()
+                      .filter(pl.col('job_title') == target_job)
+                      .group_by('experience_level')
+                      .agg(pl.col('salary_in_usd').sum().alias('sum'),
+                           pl.len().alias('count'))
+                      .collect())
+            if result.height == 0: return None
+            sums = np.zeros(4)
+            counts = np.zeros(4, dtype=np.int64)
+            for level, level_sum, level_count in result.iter_rows():
+                if level in self._EXPERIENCE_ORDER:
+                    i = self._EXPERIENCE_ORDER.index(level)
+                    sums[i], counts[i] = level_sum, level_count
+            if counts.sum() == 0: return None
+            return self._format_experience_table(sums, counts)
+
+        categories = self.df['job_title'].cat.categories
+        if target_job not in categories: return None
+        target_code = categories.get_loc(target_job)
+
+        title_codes = self.df['job_title'].cat.codes.to_numpy()
+        exp_codes = self.df['experience_level'].cat.codes.to_numpy()
+        salaries = self._salary
+
+        mask = (title_codes == target_code) & (exp_codes >= 0)
+        if not mask.any(): return None
+
+        sums = np.bincount(exp_codes[mask], weights=salaries[mask], minlength=4)
+        counts = np.bincount(exp_codes[mask], minlength=4)
+        return self._format_experience_table(sums, counts)
 
     def _build_experience_table(self, data_frame: pd.DataFrame) -> pd.DataFrame:
         """
@@ -161,11 +548,25 @@ class JobAnalyzer:
         Returns:
             pd.DataFrame: Formatted dataframe with 'Experience Level' and 'Avg Salary'.
         """
-        stats = data_frame.groupby('experience_level')['salary_in_usd'].mean()
-        order = ['EN', 'MI', 'SE', 'EX']
-        stats = stats.reindex(order).dropna()
-        df = stats.reset_index()
-        df.columns = ['Experience Level', 'Avg Salary']
-        codes = {'EN': 'Entry-level (Junior)', 'MI': 'Mid-level', 'SE': 'Senior', 'EX': 'Executive'}
-        df['Experience Level'] = df['Experience Level'].replace(codes)
-        return df
\ No newline at end of file
+        if data_frame is self.df:
+            sums, counts = self._exp_sums, self._exp_counts
+        else:
+            sums, counts = self._experience_bincounts(data_frame)
+        return self._format_experience_table(sums, counts)
+
+    def _format_experience_table(self, sums: np.ndarray, counts: np.ndarray) -> pd.DataFrame:
+        """
+        Formats per-level salary sums and counts into a display table.
+
+        Args:
+            sums (np.ndarray): Salary sums per experience level code.
+            counts (np.ndarray): Row counts per experience level code.
+
+        Returns:
+            pd.DataFrame: Formatted dataframe with 'Experience Level' and 'Avg Salary'.
+        """
+        means = sums / np.where(counts > 0, counts, 1)
+        return pd.DataFrame([
+            {'Experience Level': self._EXPERIENCE_LABELS[i], 'Avg Salary': means[i]}
+            for i in range(len(self._EXPERIENCE_LABELS)) if counts[i] > 0
+        ])
\ No newline at end of file
@@ -1,7 +1,53 @@
+import os
+
+import matplotlib
+if not os.environ.get('DISPLAY') and not os.environ.get('MPLBACKEND'):
+    matplotlib.use('Agg')
 import matplotlib.pyplot as plt
+import numpy as np
 import seaborn as sns
 import pandas as pd
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    from scipy.stats import gaussian_kde
+except ImportError:
+    gaussian_kde = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _top_n_mask(title_codes, n_titles, n):
+        """
+        Fused kernel: counts titles, picks the top N and flags matching rows.
+
+        Args:
+            title_codes (np.ndarray): Categorical codes of the job_title column.
+            n_titles (int): The number of distinct job titles (categories).
+            n (int): The number of top titles to keep.
+
+        Returns:
+            np.ndarray: Boolean mask of rows belonging to the top N titles.
+        """
+        counts = np.zeros(n_titles, np.int64)
+        for c in title_codes:
+            if c >= 0:
+                counts[c] += 1
+        top = np.argsort(-counts)[:n]
+        keep = np.zeros(n_titles, np.bool_)
+        for t in top:
+            keep[t] = True
+        mask = np.empty(len(title_codes), np.bool_)
+        for i in range(len(title_codes)):
+            c = title_codes[i]
+            mask[i] = (c >= 0) and keep[c]
+        return mask
+else:
+    _top_n_mask = None
+
 class JobVisualizer:
     """
     A class to visualize job market data using Matplotlib and Seaborn.
@@ -18,8 +64,39 @@ class JobVisualizer:
             dataframe (pd.DataFrame): The cleaned dataframe from JobAnalyzer.
         """
         self.df = dataframe
+        self._fig = None
+        self._ax = None
+        self._salary_hist = None
         sns.set_theme(style="whitegrid")
 
+    def _axes(self, figsize: tuple) -> plt.Axes:
+        """
+        Returns the reusable axes, cleared and resized for the next plot.
+
+        Creating and closing a figure per plot is the dominant cost for small
+        datasets, so one Figure/Axes pair is cached on the instance.
+
+        Args:
+            figsize (tuple): The (width, height) of the plot in inches.
+
+        Returns:
+            plt.Axes: The cleared axes to draw on.
+        """
+        if self._fig is None:
+            self._fig, self._ax = plt.subplots(figsize=figsize, constrained_layout=True)
+        else:
+            self._ax.clear()
+            self._fig.set_size_inches(figsize)
+        return self._ax
+
+    @staticmethod
+    def _show() -> None:
+        """
+        Displays the current figure unless running on a non-interactive backend.
+        """
+        if matplotlib.get_backend().lower() != 'agg':
+            plt.show()
+
     def plot_salary_distribution(self) -> None:
         """
         Plots the salary distribution histogram with a Kernel Density Estimate (KDE).
@@ -27,14 +104,31 @@ class JobVisualizer:
         Displays a histogram showing the frequency of different salary ranges 
         converted to USD.
         """
-        plt.figure(figsize=(12, 6))
-        sns.histplot(self.df['salary_in_usd'], kde=True, color='teal')
-        
-        plt.title('Salary Distribution (USD)')
-        plt.xlabel('Salary in USD')
-        plt.ylabel('Number of Vacancies')
-        plt.ticklabel_format(style='plain', axis='x')
-        plt.show()
+        if self._salary_hist is None:
+            salaries = self.df['salary_in_usd'].to_numpy(dtype=np.float64)
+            counts, edges = np.histogram(salaries, bins='fd')
+            kde_x = kde_y = None
+            if gaussian_kde is not None and salaries.size > 1:
+                try:
+                    kde_x = np.linspace(edges[0], edges[-1], 200)
+                    # Scale the density to count space so it overlays the bars.
+                    kde_y = gaussian_kde(salaries)(kde_x) * salaries.size * (edges[1] - edges[0])
+                except np.linalg.LinAlgError:
+                    # Zero-variance data has no KDE; keep the bars-only plot.
+                    kde_x = kde_y = None
+            self._salary_hist = (counts, edges, kde_x, kde_y)
+        counts, edges, kde_x, kde_y = self._salary_hist
+
+        ax = self._axes((12, 6))
+        ax.stairs(counts, edges, fill=True, color='teal', alpha=0.6)
+        if kde_x is not None:
+            ax.plot(kde_x, kde_y, color='teal')
+
+        ax.set_title('Salary Distribution (USD)')
+        ax.set_xlabel('Salary in USD')
+        ax.set_ylabel('Number of Vacancies')
+        ax.ticklabel_format(style='plain', axis='x')
+        self._show()
 
     def plot_top_jobs(self, n: int) -> None:
         """
@@ -44,13 +138,13 @@ class JobVisualizer:
             n (int): The number of top job titles to display.
         """
         top = self.df['job_title'].value_counts().head(n)
-        
-        plt.figure(figsize=(12, 8))
-        sns.barplot(x=top.values, y=top.index, palette='viridis')
-        
-        plt.title(f'Top-{n} Job Titles')
-        plt.xlabel('Number of Vacancies')
-        plt.show()
+
+        ax = self._axes((12, 8))
+        sns.barplot(x=top.values, y=top.index, palette='viridis', ax=ax)
+
+        ax.set_title(f'Top-{n} Job Titles')
+        ax.set_xlabel('Number of Vacancies')
+        self._show()
 
     def plot_salary_by_job(self, n: int) -> None:
         """
@@ -62,19 +156,31 @@ class JobVisualizer:
         Args:
             n (int): The number of top job titles to include in the plot.
         """
-        top_jobs = self.df['job_title'].value_counts().head(n).index
-        
-        df_filtered = self.df[self.df['job_title'].isin(top_jobs)]
-        
-        plt.figure(figsize=(14, 8))
-        
-        sns.boxplot(data=df_filtered, x='salary_in_usd', y='job_title', palette='coolwarm')
-        
-        plt.title(f'Salary Ranges for Top-{n} Professions')
-        plt.xlabel('Salary (USD)')
-        plt.ylabel('Job Title')
-        plt.ticklabel_format(style='plain', axis='x')
-        plt.show()
+        is_categorical = isinstance(self.df['job_title'].dtype, pd.CategoricalDtype)
+        if _top_n_mask is not None and is_categorical:
+            title_codes = self.df['job_title'].cat.codes.to_numpy()
+            mask = _top_n_mask(title_codes, len(self.df['job_title'].cat.categories), n)
+            df_filtered = self.df[mask]
+        elif is_categorical:
+            top_jobs = self.df['job_title'].value_counts().head(n).index
+            top_codes = self.df['job_title'].cat.categories.get_indexer(top_jobs)
+            mask = np.isin(self.df['job_title'].cat.codes.to_numpy(), top_codes)
+            df_filtered = self.df[mask]
+        else:
+            top_jobs = self.df['job_title'].value_counts().head(n).index
+            df_filtered = self.df[self.df['job_title'].isin(top_jobs)]
+        if is_categorical:
+            df_filtered = df_filtered.assign(
+                job_title=df_filtered['job_title'].cat.remove_unused_categories())
+
+        ax = self._axes((14, 8))
+        sns.boxplot(data=df_filtered, x='salary_in_usd', y='job_title', palette='coolwarm', ax=ax)
+
+        ax.set_title(f'Salary Ranges for Top-{n} Professions')
+        ax.set_xlabel('Salary (USD)')
+        ax.set_ylabel('Job Title')
+        ax.ticklabel_format(style='plain', axis='x')
+        self._show()
 
     def plot_experience_salaries(self) -> None:
         """
@@ -88,10 +194,10 @@ class JobVisualizer:
         labels = {'EN': 'Junior', 'MI': 'Middle', 'SE': 'Senior', 'EX': 'Executive'}
         data.index = [labels.get(x, x) for x in data.index]
 
-        plt.figure(figsize=(10, 6))
-        sns.barplot(x=data.index, y=data.values, palette='magma')
-        
-        plt.title('Average Salary by Experience Level')
-        plt.ylabel('Salary (USD)')
-        plt.xlabel('Experience Level')
-        plt.show()
\ No newline at end of file
+        ax = self._axes((10, 6))
+        sns.barplot(x=data.index, y=data.values, palette='magma', ax=ax)
+
+        ax.set_title('Average Salary by Experience Level')
+        ax.set_ylabel('Salary (USD)')
+        ax.set_xlabel('Experience Level')
+        self._show()
\ No newline at end of file
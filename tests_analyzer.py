@@ -1,7 +1,8 @@
 import unittest
+from unittest import mock
 import pandas as pd
 import os
-from job_market.analyzer import JobAnalyzer
+from job_market.analyzer import JobAnalyzer, pl
 
 class TestJob(unittest.TestCase):
     def setUp(self):
@@ -18,8 +19,9 @@ class TestJob(unittest.TestCase):
 
     def tearDown(self):
 
-        if os.path.exists('test_data.csv'):
-            os.remove('test_data.csv')
+        for path in ('test_data.csv', 'test_data.csv.parquet'):
+            if os.path.exists(path):
+                os.remove(path)
 
     def test_stats(self):
 
@@ -27,11 +29,73 @@ class TestJob(unittest.TestCase):
         self.assertEqual(stats['avg'], 2000)
         self.assertEqual(stats['min'], 1000)
 
+    def test_parquet_sidecar_reload(self):
+
+        self.assertTrue(os.path.exists('test_data.csv.parquet'))
+        cached = JobAnalyzer('test_data.csv')
+        self.assertEqual(cached.get_salary_stats(), self.app.get_salary_stats())
+        self.assertEqual(cached.get_top_professions(2).to_dict(),
+                         self.app.get_top_professions(2).to_dict())
+
+        data = {
+            'Title': ['QA'],
+            'Salary': [5000],
+            'Experience': ['SE']
+        }
+        pd.DataFrame(data).to_csv('test_data.csv', index=False)
+        stale = os.path.getmtime('test_data.csv') - 10
+        os.utime('test_data.csv.parquet', (stale, stale))
+
+        refreshed = JobAnalyzer('test_data.csv')
+        self.assertEqual(refreshed.get_salary_stats()['max'], 5000)
+
+    def test_corrupt_sidecar_falls_back_to_csv(self):
+
+        with open('test_data.csv.parquet', 'wb') as f:
+            f.write(b'not a parquet file')
+        fresh = os.path.getmtime('test_data.csv') + 10
+        os.utime('test_data.csv.parquet', (fresh, fresh))
+
+        app = JobAnalyzer('test_data.csv')
+        self.assertEqual(app.get_salary_stats(), self.app.get_salary_stats())
+
+        rebuilt = JobAnalyzer('test_data.csv')
+        self.assertEqual(rebuilt.get_salary_stats(), self.app.get_salary_stats())
+
+    def test_from_large_csv(self):
+
+        app = JobAnalyzer.from_large_csv('test_data.csv', chunksize=2)
+        stats = app.get_salary_stats()
+        self.assertEqual(stats['avg'], 2000)
+        self.assertEqual(stats['max'], 3000)
+        self.assertEqual(app.get_top_professions(1).index[0], 'Dev')
+
     def test_top_jobs(self):
 
         top = self.app.get_top_professions(1)
         self.assertEqual(top.index[0], 'Dev')
         self.assertEqual(top.values[0], 2)
 
+    @unittest.skipIf(pl is None, 'polars is not installed')
+    def test_polars_backend(self):
+
+        app = JobAnalyzer('test_data.csv', backend='polars')
+        self.assertEqual(app.get_salary_stats(), self.app.get_salary_stats())
+        self.assertEqual(app.get_top_professions(2).to_dict(),
+                         self.app.get_top_professions(2).to_dict())
+        self.assertTrue(app.get_salary_growth_for_job('Dev')
+                        .equals(self.app.get_salary_growth_for_job('Dev')))
+
+    def test_unknown_backend(self):
+
+        with self.assertRaises(ValueError):
+            JobAnalyzer('test_data.csv', backend='dask')
+
+    def test_polars_backend_unavailable(self):
+
+        with mock.patch('job_market.analyzer.pl', None):
+            with self.assertRaises(ImportError):
+                JobAnalyzer('test_data.csv', backend='polars')
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file